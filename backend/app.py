@@ -1,10 +1,15 @@
-from flask import Flask, request, jsonify
+from flask import Flask, request, jsonify, Response
 from flask_cors import CORS
 import logging
 import traceback
 from github_utils import clone_and_parse_repo
 from ai_writer import generate_blog
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+import json
 import os
+import queue
+import threading
 import requests
 
 # Configure logging
@@ -14,6 +19,111 @@ logger = logging.getLogger(__name__)
 app = Flask(__name__)
 CORS(app)
 
+def int_from_env(name, default):
+    """Read a positive integer setting from the environment, falling back to the default if it is invalid."""
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    try:
+        parsed = int(value)
+    except ValueError:
+        logger.warning(f"Invalid value for {name}: {value!r}, using default {default}")
+        return default
+    if parsed < 1:
+        logger.warning(f"{name} must be at least 1, got {parsed}, using default {default}")
+        return default
+    return parsed
+
+# Separate pools so git I/O for later repos overlaps LLM calls for earlier ones.
+# Both stages are network-bound: cloning is sized for one full batch and
+# generation for several. A repo holds one generation slot from clone start
+# until its blog is done, which also bounds how much cloned metadata can wait
+# between the stages.
+MAX_BATCH_SIZE = int_from_env("MAX_BATCH_SIZE", 50)
+BATCH_CONCURRENCY = int_from_env("BATCH_CONCURRENCY", MAX_BATCH_SIZE)
+CLONE_WORKERS = int_from_env("CLONE_WORKERS", MAX_BATCH_SIZE)
+GENERATE_WORKERS = int_from_env("GENERATE_WORKERS", 2 * MAX_BATCH_SIZE)
+POLL_INTERVAL = 0.5
+clone_executor = ThreadPoolExecutor(max_workers=CLONE_WORKERS, thread_name_prefix="clone")
+generate_executor = ThreadPoolExecutor(max_workers=GENERATE_WORKERS, thread_name_prefix="generate")
+repo_slots = threading.BoundedSemaphore(GENERATE_WORKERS)
+
+def process_repos(repo_urls):
+    """Clone and generate blogs for several repositories, yielding results as each one completes."""
+    results = queue.Queue()
+    abandoned = threading.Event()
+    futures = []
+    batch_limit = min(len(repo_urls), BATCH_CONCURRENCY)
+
+    def finish(result=None):
+        repo_slots.release()
+        if result is not None:
+            results.put(result)
+
+    def on_generated(repo_url, future):
+        if future.cancelled():
+            finish()
+            return
+        try:
+            finish({"repo_url": repo_url, "blog": future.result()})
+        except Exception as e:
+            logger.error(f"Error in generate_blog for {repo_url}: {str(e)}")
+            finish({"repo_url": repo_url, "error": f"Failed to generate blog post: {str(e)}"})
+
+    def on_cloned(repo_url, future):
+        if future.cancelled() or abandoned.is_set():
+            finish()
+            return
+        try:
+            metadata = future.result()
+        except Exception as e:
+            logger.error(f"Error in clone_and_parse_repo for {repo_url}: {str(e)}")
+            finish({"repo_url": repo_url, "error": f"Failed to clone or parse repository: {str(e)}"})
+            return
+        try:
+            generate_future = generate_executor.submit(generate_blog, metadata)
+        except Exception as e:
+            logger.error(f"Error submitting generate_blog for {repo_url}: {str(e)}")
+            finish({"repo_url": repo_url, "error": f"Failed to generate blog post: {str(e)}"})
+            return
+        futures.append(generate_future)
+        if abandoned.is_set():
+            generate_future.cancel()
+        generate_future.add_done_callback(partial(on_generated, repo_url))
+
+    pending = list(repo_urls)
+    in_flight = 0
+    try:
+        for _ in repo_urls:
+            while True:
+                # Keep at most batch_limit repos of this batch in flight, and
+                # only start one when a shared slot is free, so concurrent
+                # batches interleave instead of queueing behind each other
+                while pending and in_flight < batch_limit and repo_slots.acquire(blocking=False):
+                    repo_url = pending.pop(0)
+                    try:
+                        clone_future = clone_executor.submit(clone_and_parse_repo, repo_url)
+                    except Exception:
+                        repo_slots.release()
+                        raise
+                    in_flight += 1
+                    futures.append(clone_future)
+                    clone_future.add_done_callback(partial(on_cloned, repo_url))
+                try:
+                    result = results.get(timeout=POLL_INTERVAL)
+                    break
+                except queue.Empty:
+                    continue
+            in_flight -= 1
+            yield result
+    finally:
+        # Client went away (or we finished): drop this batch's queued work.
+        # Clones and LLM calls that are already running cannot be interrupted
+        # and finish in the background.
+        abandoned.set()
+        for f in list(futures):
+            f.cancel()
+
 @app.route('/generate-blog', methods=['POST'])
 def generate_blog_route():
     try:
@@ -46,6 +156,33 @@ def generate_blog_route():
         logger.error(traceback.format_exc())
         return jsonify({"error": str(e)}), 500
 
+@app.route('/generate-blogs', methods=['POST'])
+def generate_blogs_route():
+    data = request.get_json(silent=True)
+    repo_urls = data.get('repo_urls') if isinstance(data, dict) else None
+
+    if not isinstance(repo_urls, list) or not repo_urls:
+        logger.warning("Request received without repo_urls")
+        return jsonify({"error": "Repository URLs not provided"}), 400
+
+    if not all(isinstance(url, str) and url.strip() for url in repo_urls):
+        return jsonify({"error": "Repository URLs must be non-empty strings"}), 400
+
+    # Drop duplicates so the same repository is not cloned and generated twice
+    repo_urls = list(dict.fromkeys(url.strip() for url in repo_urls))
+
+    if len(repo_urls) > MAX_BATCH_SIZE:
+        logger.warning(f"Batch request with {len(repo_urls)} repositories exceeds limit of {MAX_BATCH_SIZE}")
+        return jsonify({"error": f"Too many repositories: at most {MAX_BATCH_SIZE} per request"}), 400
+
+    logger.info(f"Processing batch request for {len(repo_urls)} repositories")
+
+    def stream():
+        for result in process_repos(repo_urls):
+            yield json.dumps(result) + "\n"
+
+    return Response(stream(), mimetype='application/x-ndjson')
+
 @app.route('/health', methods=['GET'])
 def health_check():
     return jsonify({"status": "ok"}), 200